@@ -4,20 +4,38 @@ Standalone API server for Vancouver Public Art Status
 
 This provides a REST API for checking status of Vancouver public art objects.
 It can be used as an alternative to the direct tool integration with Open WebUI.
+
+Run it under a production WSGI server, e.g.:
+
+    gunicorn -w 4 -k gthread --threads 8 -b 0.0.0.0:5000 api_server:app
+
+Set USE_DEV_SERVER=1 (or "true"/"yes") to use Flask's built-in development server instead.
 """
 
 import os
-from flask import Flask, request, jsonify, render_template_string
+import orjson
+from flask import Flask, Response, request
+from flask_caching import Cache
 from flask_cors import CORS
 from vancouver_art_status_tools import Tools
 
+
+def json_response(obj, status=200):
+    """Serialize obj with orjson straight into a JSON response"""
+    return Response(orjson.dumps(obj), status=status, mimetype="application/json")
+
+
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
 
+# Responses only change when the markdown files do, so cache them per query string
+cache = Cache(app, config={"CACHE_TYPE": "SimpleCache", "CACHE_DEFAULT_TIMEOUT": 300})
+
 # Initialize the tools
 tools = Tools()
 
 @app.route('/status', methods=['GET'])
+@cache.cached(query_string=True)
 def get_status():
     """
     API endpoint to get status of an artwork
@@ -30,12 +48,13 @@ def get_status():
     details = request.args.get('details', 'false').lower() == 'true'
     
     if not query:
-        return jsonify({"error": "No artwork name provided"}), 400
+        return json_response({"error": "No artwork name provided"}, 400)
     
     result = tools.get_artwork_status(query, details)
-    return jsonify({"result": result})
+    return json_response({"result": result})
 
 @app.route('/list', methods=['GET'])
+@cache.cached(query_string=True)
 def list_artworks():
     """
     API endpoint to list active artworks
@@ -48,9 +67,10 @@ def list_artworks():
     limit = int(request.args.get('limit', 5))
     
     result = tools.list_active_artworks(neighborhood, limit)
-    return jsonify({"result": result})
+    return json_response({"result": result})
 
 @app.route('/compare', methods=['GET'])
+@cache.cached(query_string=True)
 def compare_artworks():
     """
     API endpoint to compare multiple artworks
@@ -61,74 +81,81 @@ def compare_artworks():
     query = request.args.get('q', '')
     
     if not query:
-        return jsonify({"error": "No artwork names provided"}), 400
+        return json_response({"error": "No artwork names provided"}, 400)
     
     result = tools.compare_artwork_status(query)
-    return jsonify({"result": result})
+    return json_response({"result": result})
+
+# The homepage has no dynamic content, so it is built once at import time
+_HOME_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Vancouver Public Art Status API</title>
+    <style>
+        body { font-family: Arial, sans-serif; max-width: 800px; margin: 0 auto; padding: 20px; line-height: 1.6; }
+        h1, h2, h3 { color: #333; }
+        code { background-color: #f4f4f4; padding: 2px 5px; border-radius: 3px; font-family: monospace; }
+        pre { background-color: #f4f4f4; padding: 10px; border-radius: 5px; overflow-x: auto; }
+        .endpoint { margin-bottom: 30px; border-bottom: 1px solid #eee; padding-bottom: 20px; }
+    </style>
+</head>
+<body>
+    <h1>Vancouver Public Art Status API</h1>
+    <p>This API provides information about the status of public art objects in Vancouver.</p>
+    
+    <div class="endpoint">
+        <h2>1. Get Artwork Status</h2>
+        <p>Check the status of a specific artwork:</p>
+        <code>GET /status?q=ARTWORK_NAME&details=false</code>
+        <h3>Parameters:</h3>
+        <ul>
+            <li><strong>q</strong>: The name of the artwork to look up</li>
+            <li><strong>details</strong>: (optional) Set to 'true' to include more details</li>
+        </ul>
+        <h3>Example:</h3>
+        <pre>GET /status?q=Digital Orca&details=true</pre>
+    </div>
+    
+    <div class="endpoint">
+        <h2>2. List Active Artworks</h2>
+        <p>List artworks that are currently in place:</p>
+        <code>GET /list?neighborhood=AREA&limit=5</code>
+        <h3>Parameters:</h3>
+        <ul>
+            <li><strong>neighborhood</strong>: (optional) Filter by neighborhood</li>
+            <li><strong>limit</strong>: (optional) Maximum number of results to return</li>
+        </ul>
+        <h3>Example:</h3>
+        <pre>GET /list?neighborhood=Stanley Park&limit=10</pre>
+    </div>
+    
+    <div class="endpoint">
+        <h2>3. Compare Artworks</h2>
+        <p>Compare the status of multiple artworks:</p>
+        <code>GET /compare?q=ARTWORK1,ARTWORK2,ARTWORK3</code>
+        <h3>Parameters:</h3>
+        <ul>
+            <li><strong>q</strong>: Comma-separated list of artwork names to compare</li>
+        </ul>
+        <h3>Example:</h3>
+        <pre>GET /compare?q=Digital Orca,Girl in Wetsuit,The Drop</pre>
+    </div>
+</body>
+</html>
+"""
 
 @app.route('/', methods=['GET'])
 def home():
     """Homepage with API documentation"""
-    html = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Vancouver Public Art Status API</title>
-        <style>
-            body { font-family: Arial, sans-serif; max-width: 800px; margin: 0 auto; padding: 20px; line-height: 1.6; }
-            h1, h2, h3 { color: #333; }
-            code { background-color: #f4f4f4; padding: 2px 5px; border-radius: 3px; font-family: monospace; }
-            pre { background-color: #f4f4f4; padding: 10px; border-radius: 5px; overflow-x: auto; }
-            .endpoint { margin-bottom: 30px; border-bottom: 1px solid #eee; padding-bottom: 20px; }
-        </style>
-    </head>
-    <body>
-        <h1>Vancouver Public Art Status API</h1>
-        <p>This API provides information about the status of public art objects in Vancouver.</p>
-        
-        <div class="endpoint">
-            <h2>1. Get Artwork Status</h2>
-            <p>Check the status of a specific artwork:</p>
-            <code>GET /status?q=ARTWORK_NAME&details=false</code>
-            <h3>Parameters:</h3>
-            <ul>
-                <li><strong>q</strong>: The name of the artwork to look up</li>
-                <li><strong>details</strong>: (optional) Set to 'true' to include more details</li>
-            </ul>
-            <h3>Example:</h3>
-            <pre>GET /status?q=Digital Orca&details=true</pre>
-        </div>
-        
-        <div class="endpoint">
-            <h2>2. List Active Artworks</h2>
-            <p>List artworks that are currently in place:</p>
-            <code>GET /list?neighborhood=AREA&limit=5</code>
-            <h3>Parameters:</h3>
-            <ul>
-                <li><strong>neighborhood</strong>: (optional) Filter by neighborhood</li>
-                <li><strong>limit</strong>: (optional) Maximum number of results to return</li>
-            </ul>
-            <h3>Example:</h3>
-            <pre>GET /list?neighborhood=Stanley Park&limit=10</pre>
-        </div>
-        
-        <div class="endpoint">
-            <h2>3. Compare Artworks</h2>
-            <p>Compare the status of multiple artworks:</p>
-            <code>GET /compare?q=ARTWORK1,ARTWORK2,ARTWORK3</code>
-            <h3>Parameters:</h3>
-            <ul>
-                <li><strong>q</strong>: Comma-separated list of artwork names to compare</li>
-            </ul>
-            <h3>Example:</h3>
-            <pre>GET /compare?q=Digital Orca,Girl in Wetsuit,The Drop</pre>
-        </div>
-    </body>
-    </html>
-    """
-    return render_template_string(html)
+    return _HOME_HTML
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5000))
-    print(f"Server starting on http://localhost:{port}")
-    app.run(host="0.0.0.0", port=port)
\ No newline at end of file
+    if os.environ.get("USE_DEV_SERVER", "").lower() in ("1", "true", "yes"):
+        print(f"Server starting on http://localhost:{port}")
+        app.run(host="0.0.0.0", port=port)
+    else:
+        print("The Flask development server handles one request at a time. Run the API with:")
+        print(f"    gunicorn -w 4 -k gthread --threads 8 -b 0.0.0.0:{port} api_server:app")
+        print("or set USE_DEV_SERVER=1 to start the development server anyway.")
\ No newline at end of file
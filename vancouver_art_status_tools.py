@@ -1,76 +1,352 @@
 import os
 import re
-import glob
 import json
+import functools
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
 from typing import Dict, List, Optional, Union, Any
 
+# Parsed database is cached next to this file; bump the version whenever the cache layout
+# or the parsing output changes, so stale caches are re-parsed
+_CACHE_FILENAME = "status_db.json"
+_CACHE_VERSION = 5
+
+# Length of the substrings indexed for fuzzy lookups
+_NGRAM_SIZE = 3
+
+# Number of responses remembered per tool method
+_RESPONSE_CACHE_SIZE = 512
+
+# Separator for comma-separated artwork names, including surrounding whitespace
+_SPLIT_RE = re.compile(r'\s*,\s*')
+
+
+@dataclass
+class ArtworkEntry:
+    """
+    One artwork as loaded from its markdown file
+    """
+    # Explicit slots keep entries compact (dataclass(slots=True) needs Python 3.10)
+    __slots__ = ("name", "title", "title_lower", "status", "location", "neighborhood",
+                 "neighborhood_lower", "description", "filename")
+    
+    name: str
+    title: str
+    title_lower: str
+    status: str
+    location: str
+    neighborhood: str
+    neighborhood_lower: str
+    description: str
+    filename: str
+
+
+def _parse_sections(content: str) -> Dict[str, str]:
+    """
+    Split a markdown file into its "## Header" sections in a single pass
+
+    :param content: The raw markdown text.
+    :return: Mapping of header name to the section body (first occurrence wins).
+    """
+    sections = {}
+    for chunk in ("\n" + content).split("\n## ")[1:]:
+        header, _, body = chunk.partition("\n")
+        sections.setdefault(header.strip(), body)
+    return sections
+
+
+def _first_line(body: str) -> str:
+    """Return the first non-blank line of a section body"""
+    return body.strip().split("\n", 1)[0].strip()
+
+
+def _ngrams(text: str) -> set:
+    """Return the set of all substrings of length _NGRAM_SIZE in text"""
+    return {text[i:i + _NGRAM_SIZE] for i in range(len(text) - _NGRAM_SIZE + 1)}
+
+
+def _parse_artwork_file(md_file: str, filename: str) -> ArtworkEntry:
+    """
+    Read one artwork markdown file into a database entry
+
+    :param md_file: Path to the markdown file.
+    :param filename: The file's name within the art directory.
+    :return: The artwork's name, title, status, location, neighborhood, description and filename.
+    """
+    artwork_name = filename[:-len(".md")]
+    
+    with open(md_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    sections = _parse_sections(content)
+    
+    # Extract title if available
+    title = _first_line(sections.get("Title of Work", "")) or artwork_name
+    
+    # Extract status
+    status = _first_line(sections.get("Status", "")) or "Unknown"
+    
+    # Extract additional info if we want it
+    description = sections.get("DescriptionOfwork", "").split("\n##", 1)[0].strip()
+    location = _first_line(sections.get("LocationOnsite", ""))
+    neighborhood = _first_line(sections.get("Neighbourhood", ""))
+    
+    # Only an excerpt of the description is ever shown
+    short_desc = (description[:300] + "...") if len(description) > 300 else description
+    
+    return ArtworkEntry(
+        name=artwork_name,
+        title=title,
+        title_lower=title.lower(),
+        status=status,
+        location=location,
+        neighborhood=neighborhood,
+        neighborhood_lower=neighborhood.lower(),
+        description=short_desc,
+        filename=filename
+    )
+
+
+def _read_cache(cache_path: str, fingerprint: Dict[str, Any]) -> Optional[List[ArtworkEntry]]:
+    """
+    Load the database from the on-disk cache if it was written for the current markdown files
+
+    :param cache_path: Path to the JSON cache file.
+    :param fingerprint: Directory mtime and the name, mtime and size of every markdown file.
+    :return: The cached entries, or None if the cache is missing, stale or malformed.
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if not isinstance(cache, dict) or cache.get("version") != _CACHE_VERSION or cache.get("fingerprint") != fingerprint:
+        return None
+    
+    try:
+        entries = []
+        for entry in cache["entries"]:
+            if not all(isinstance(value, str) for value in entry.values()):
+                return None
+            entries.append(ArtworkEntry(**entry))
+    except (AttributeError, KeyError, TypeError):
+        return None
+    
+    return entries
+
+
+def _write_cache(cache_path: str, fingerprint: Dict[str, Any], entries: List[ArtworkEntry]):
+    """
+    Save the parsed database so the next start can skip parsing the markdown files
+
+    :param cache_path: Path to the JSON cache file.
+    :param fingerprint: Directory mtime and the name, mtime and size of every markdown file.
+    :param entries: The parsed artworks.
+    """
+    # Write to a temporary file and swap it in, so concurrent workers never see a partial cache
+    tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "version": _CACHE_VERSION,
+                "fingerprint": fingerprint,
+                "entries": [asdict(art) for art in entries]
+            }, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Could not write cache {cache_path}: {str(e)}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _load_status_database() -> List[ArtworkEntry]:
+    """
+    Load the status of all artwork from markdown files, or from the cache if they haven't changed
+
+    :return: One entry per artwork, in directory order.
+    """
+    # Path to the public art markdown files
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    art_dir = os.path.join(base_dir, "public_art_vancouver")
+    cache_path = os.path.join(base_dir, _CACHE_FILENAME)
+    md_files = []
+    dir_mtime_ns = None
+    failed = False
+    try:
+        with os.scandir(art_dir) as it:
+            for e in it:
+                if not e.name.endswith(".md") or e.name.startswith("."):
+                    continue
+                # Stat each file on its own so one that vanishes mid-listing only drops itself
+                try:
+                    if e.is_file():
+                        md_files.append((e.path, e.name, e.stat()))
+                except OSError as err:
+                    print(f"Error processing {e.path}: {str(err)}")
+                    failed = True
+        dir_mtime_ns = os.stat(art_dir).st_mtime_ns
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        print(f"Error reading {art_dir}: {str(e)}")
+        failed = True
+    
+    # The cache is only reused if the directory and every file in it look exactly as they did when it was written
+    fingerprint = None
+    if md_files and dir_mtime_ns is not None and not failed:
+        fingerprint = {
+            "dir_mtime_ns": dir_mtime_ns,
+            "files": sorted([name, st.st_mtime_ns, st.st_size] for _, name, st in md_files)
+        }
+        entries = _read_cache(cache_path, fingerprint)
+        if entries is not None:
+            print(f"Loaded status for {len(entries)} art objects from cache")
+            return entries
+    
+    # Reading the files is I/O bound, so parse them on a thread pool and collect in order
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        futures = [executor.submit(_parse_artwork_file, path, name) for path, name, _ in md_files]
+    
+    entries = []
+    for (md_file, _, _), future in zip(md_files, futures):
+        try:
+            entries.append(future.result())
+        except Exception as e:
+            print(f"Error processing {md_file}: {str(e)}")
+            failed = True
+    
+    print(f"Loaded status for {len(entries)} art objects")
+    
+    # Don't cache a partial load, or the failed files would be silently skipped on every start
+    if fingerprint is not None and not failed:
+        _write_cache(cache_path, fingerprint, entries)
+    
+    return entries
+
+
+def _append_section(parts: List[str], heading: str, items: List[str]):
+    """
+    Append a numbered list under a heading, followed by a blank line; nothing if there are no items
+    """
+    if not items:
+        return
+    parts.append(f"{heading}\n")
+    parts.extend(f"{i}. {item}\n" for i, item in enumerate(items, 1))
+    parts.append("\n")
+
+
+def _build_indexes(tools: "Tools"):
+    """
+    Map lowercase filenames and titles to entries, index their trigrams for fuzzy lookups
+    and group them by status and neighborhood
+
+    :param tools: The Tools instance whose entries are indexed.
+    """
+    tools.alias_to_idx = {}
+    tools._name_keys = [art.name.lower() for art in tools.entries]
+    tools._ngram_index = defaultdict(set)
+    for i, art in enumerate(tools.entries):
+        name_key = tools._name_keys[i]
+        title_key = art.title_lower
+        tools.alias_to_idx[name_key] = i
+        tools.alias_to_idx[title_key] = i
+        for gram in _ngrams(name_key) | _ngrams(title_key):
+            tools._ngram_index[gram].add(i)
+    
+    tools.by_status = defaultdict(list)
+    tools.by_neighborhood = defaultdict(list)
+    neighborhoods = set()
+    for art in sorted(tools.entries, key=lambda x: x.title):
+        tools.by_status[art.status].append(art)
+        if art.neighborhood:
+            tools.by_neighborhood[art.neighborhood_lower].append(art)
+            neighborhoods.add(art.neighborhood)
+    tools.neighborhoods_sorted = sorted(neighborhoods)
+
+
+def _reload(tools: "Tools"):
+    """
+    Load the database and rebuild the indexes, dropping any cached responses
+
+    :param tools: The Tools instance to (re)load.
+    """
+    tools._response_caches = {}
+    tools.entries = _load_status_database()
+    _build_indexes(tools)
+
+
+def _iter_fuzzy_matches(tools: "Tools", query: str):
+    """
+    Yield artworks whose filename or title contains the query, in database order
+
+    :param tools: The Tools instance to search.
+    :param query: The lowercase text to search for.
+    """
+    grams = _ngrams(query)
+    
+    if grams:
+        # Any name or title containing the query contains all of its trigrams
+        postings = sorted((tools._ngram_index.get(gram, set()) for gram in grams), key=len)
+        candidates = sorted(postings[0].intersection(*postings[1:]))
+    else:
+        # Too short to use the index
+        candidates = range(len(tools.entries))
+    
+    for i in candidates:
+        data = tools.entries[i]
+        if query in tools._name_keys[i] or query in data.title_lower:
+            yield data
+
+
+def _artworks_in_neighborhood(tools: "Tools", neighborhood: str) -> List[ArtworkEntry]:
+    """
+    Get the artworks whose neighborhood contains the given text, sorted by title
+
+    :param tools: The Tools instance to search.
+    :param neighborhood: The neighborhood to filter by (case insensitive).
+    """
+    query = neighborhood.lower()
+    buckets = [arts for key, arts in tools.by_neighborhood.items() if query in key]
+    if len(buckets) == 1:
+        return buckets[0]
+    return sorted((art for arts in buckets for art in arts), key=lambda x: x.title)
+
+
+def _cached_response(method):
+    """
+    Memoize a tool method's response per Tools instance; cleared by _reload()
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        cache = self._response_caches.get(method.__name__)
+        if cache is None:
+            cache = functools.lru_cache(maxsize=_RESPONSE_CACHE_SIZE)(functools.partial(method, self))
+            self._response_caches[method.__name__] = cache
+        return cache(*args, **kwargs)
+    return wrapper
+
 
 class Tools:
     def __init__(self):
-        self.status_db = {}
-        self._load_status_database()
-    
-    def _load_status_database(self):
-        """
-        Load the status of all artwork from markdown files
-        """
-        # Path to the public art markdown files
-        art_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "public_art_vancouver")
-        md_files = glob.glob(os.path.join(art_dir, "*.md"))
-        
-        for md_file in md_files:
-            filename = os.path.basename(md_file)
-            artwork_name = os.path.splitext(filename)[0]
-            
-            try:
-                with open(md_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
-                    # Extract title if available
-                    title_match = re.search(r'## Title of Work\s*\n(.*?)\n', content, re.DOTALL)
-                    title = title_match.group(1).strip() if title_match else artwork_name
-                    
-                    # Extract status
-                    status_match = re.search(r'## Status\s*\n(.*?)\n', content, re.DOTALL)
-                    status = status_match.group(1).strip() if status_match else "Unknown"
-                    
-                    # Extract additional info if we want it
-                    description_match = re.search(r'## DescriptionOfwork\s*\n(.*?)(?=\n##|\Z)', content, re.DOTALL)
-                    description = description_match.group(1).strip() if description_match else ""
-                    
-                    location_match = re.search(r'## LocationOnsite\s*\n(.*?)\n', content, re.DOTALL)
-                    location = location_match.group(1).strip() if location_match else ""
-                    
-                    neighborhood_match = re.search(r'## Neighbourhood\s*\n(.*?)\n', content, re.DOTALL)
-                    neighborhood = neighborhood_match.group(1).strip() if neighborhood_match else ""
-                    
-                    # Store in database with lowercase keys for case-insensitive lookup
-                    self.status_db[artwork_name.lower()] = {
-                        "name": artwork_name,
-                        "title": title,
-                        "status": status,
-                        "location": location,
-                        "neighborhood": neighborhood,
-                        "description": description[:300] + "..." if len(description) > 300 else description,
-                        "filename": filename
-                    }
-                    
-                    # Also index by title for easier lookup
-                    if title.lower() != artwork_name.lower():
-                        self.status_db[title.lower()] = {
-                            "name": artwork_name,
-                            "title": title,
-                            "status": status,
-                            "location": location,
-                            "neighborhood": neighborhood,
-                            "description": description[:300] + "..." if len(description) > 300 else description,
-                            "filename": filename
-                        }
-            except Exception as e:
-                print(f"Error processing {md_file}: {str(e)}")
-        
-        print(f"Loaded status for {len(self.status_db)} art objects")
+        # One entry per artwork; filenames and titles both map to its index
+        self.entries: List[ArtworkEntry] = []
+        self.alias_to_idx: Dict[str, int] = {}
+        # Lowercase filenames by entry index, and trigram -> entry indexes for fuzzy lookups
+        self._name_keys: List[str] = []
+        self._ngram_index: Dict[str, set] = {}
+        # Title-sorted artworks grouped by status and by lowercase neighborhood
+        self.by_status: Dict[str, List[ArtworkEntry]] = {}
+        self.by_neighborhood: Dict[str, List[ArtworkEntry]] = {}
+        self.neighborhoods_sorted: List[str] = []
+        self._response_caches: Dict[str, Any] = {}
+        _reload(self)
     
+    @_cached_response
     def get_artwork_status(self, artwork_name: str, include_details: bool = False) -> str:
         """
         Get the current status of a Vancouver public art object (whether it's still in place or removed)
@@ -84,176 +360,39 @@ class Tools:
         
         # Try exact match (case insensitive)
         artwork_key = artwork_name.lower()
-        if artwork_key in self.status_db:
-            art = self.status_db[artwork_key]
+        if artwork_key in self.alias_to_idx:
+            art = self.entries[self.alias_to_idx[artwork_key]]
             
             if include_details:
                 details = []
-                if art["location"]:
-                    details.append(f"Location: {art['location']}")
-                if art["neighborhood"]:
-                    details.append(f"Neighborhood: {art['neighborhood']}")
-                if art["description"]:
-                    details.append(f"Description excerpt: {art['description']}")
+                if art.location:
+                    details.append(f"Location: {art.location}")
+                if art.neighborhood:
+                    details.append(f"Neighborhood: {art.neighborhood}")
+                if art.description:
+                    details.append(f"Description excerpt: {art.description}")
                 
                 details_text = "\n".join(details) if details else "No additional details available"
-                return f"Artwork: {art['title']}\nStatus: {art['status']}\n\n{details_text}"
+                return f"Artwork: {art.title}\nStatus: {art.status}\n\n{details_text}"
             else:
-                return f"Artwork: {art['title']}\nStatus: {art['status']}"
+                return f"Artwork: {art.title}\nStatus: {art.status}"
         
         # Try fuzzy match
-        matches = []
-        for key, data in self.status_db.items():
-            if artwork_name.lower() in key or artwork_name.lower() in data["title"].lower():
-                matches.append(data)
+        matches = list(_iter_fuzzy_matches(self, artwork_key))
         
         if matches:
-            response = f"Could not find exact match for '{artwork_name}', but found {len(matches)} similar artwork(s):\n\n"
+            parts = [f"Could not find exact match for '{artwork_name}', but found {len(matches)} similar artwork(s):\n\n"]
             for i, match in enumerate(matches[:5], 1):  # Limit to top 5 matches
-                response += f"{i}. {match['title']} - Status: {match['status']}\n"
+                parts.append(f"{i}. {match.title} - Status: {match.status}\n")
             
             if len(matches) > 5:
-                response += f"\nAnd {len(matches) - 5} more matches."
+                parts.append(f"\nAnd {len(matches) - 5} more matches.")
             
-            return response
+            return "".join(parts)
         
         return f"No artwork found matching '{artwork_name}'"
     
-    def list_active_artworks(self, neighborhood: str = "", limit: int = 5) -> str:
-        """
-        List Vancouver public artworks that are currently in place, optionally filtered by neighborhood
-        
-        :param neighborhood: Optional neighborhood to filter by (e.g., "Stanley Park", "Downtown")
-        :param limit: Maximum number of results to return (default 5)
-        :return: List of active artworks with their titles and locations
-        """
-        active_artworks = []
-        
-        # Collect unique artworks (avoid duplicates from title/filename keys)
-        seen_titles = set()
-        
-        for data in self.status_db.values():
-            if data["title"] in seen_titles:
-                continue
-                
-            if data["status"] == "In place":
-                if not neighborhood or (data["neighborhood"] and neighborhood.lower() in data["neighborhood"].lower()):
-                    active_artworks.append(data)
-                    seen_titles.add(data["title"])
-        
-        # Sort by title
-        active_artworks.sort(key=lambda x: x["title"])
-        
-        if not active_artworks:
-            if neighborhood:
-                return f"No active artworks found in the {neighborhood} neighborhood"
-            else:
-                return "No active artworks found"
-        
-        # Apply limit and format response
-        limited_results = active_artworks[:limit]
-        
-        response = f"Found {len(active_artworks)} active artworks"
-        if neighborhood:
-            response += f" in or near {neighborhood}"
-        response += f" (showing {len(limited_results)}):\n\n"
-        
-        for i, art in enumerate(limited_results, 1):
-            response += f"{i}. {art['title']}"
-            if art["location"]:
-                response += f" - Located at: {art['location']}"
-            if art["neighborhood"]:
-                response += f" ({art['neighborhood']})"
-            response += "\n"
-        
-        if len(active_artworks) > limit:
-            response += f"\nThere are {len(active_artworks) - limit} more active artworks."
-        
-        return response
-    
-    def compare_artwork_status(self, artwork_names: str) -> str:
-        """
-        Compare the status of multiple Vancouver public artworks
-        
-        :param artwork_names: Comma-separated list of artwork names or titles to compare
-        :return: Comparison of the artworks' status indicating which are currently in place
-        """
-        if not artwork_names:
-            return "Error: No artwork names provided"
-        
-        names_list = [name.strip() for name in artwork_names.split(",") if name.strip()]
-        
-        if not names_list:
-            return "Error: Invalid input format. Please provide a comma-separated list of artwork names."
-        
-        results = []
-        
-        for name in names_list:
-            found = False
-            name_key = name.lower()
-            
-            # Try exact match first
-            if name_key in self.status_db:
-                art = self.status_db[name_key]
-                results.append({
-                    "name": name,
-                    "title": art["title"],
-                    "status": art["status"],
-                    "found": True
-                })
-                found = True
-            else:
-                # Try fuzzy match
-                for key, data in self.status_db.items():
-                    if name_key in key or name_key in data["title"].lower():
-                        results.append({
-                            "name": name,
-                            "title": data["title"],
-                            "status": data["status"],
-                            "found": True
-                        })
-                        found = True
-                        break
-            
-            if not found:
-                results.append({
-                    "name": name,
-                    "found": False
-                })
-        
-        # Format the response
-        response = "Artwork Status Comparison:\n\n"
-        
-        in_place = []
-        not_in_place = []
-        not_found = []
-        
-        for result in results:
-            if not result["found"]:
-                not_found.append(result["name"])
-            elif result["status"] == "In place":
-                in_place.append(result["title"])
-            else:
-                not_in_place.append(f"{result['title']} ({result['status']})")
-        
-        if in_place:
-            response += "Currently in place:\n"
-            for i, title in enumerate(in_place, 1):
-                response += f"{i}. {title}\n"
-            response += "\n"
-        
-        if not_in_place:
-            response += "Not currently in place:\n"
-            for i, title in enumerate(not_in_place, 1):
-                response += f"{i}. {title}\n"
-            response += "\n"
-        
-        if not_found:
-            response += "Not found in database:\n"
-            for i, name in enumerate(not_found, 1):
-                response += f"{i}. {name}\n"
-        
-        return response
+    @_cached_response
     def list_active_artworks(self, neighborhood: str = "", limit: int = 5) -> str:
         """
         List Vancouver public artworks that are currently in place, optionally filtered by neighborhood.
@@ -262,19 +401,10 @@ class Tools:
         :param limit: Maximum number of results to return (default 5).
         :return: List of active artworks with their titles and locations.
         """
-        active_artworks = []
-        seen_titles = set()
-
-        for data in self.status_db.values():
-            if data["title"] in seen_titles:
-                continue
-
-            if data["status"] == "In place":
-                if not neighborhood or (data["neighborhood"] and neighborhood.lower() in data["neighborhood"].lower()):
-                    active_artworks.append(data)
-                    seen_titles.add(data["title"])
-
-        active_artworks.sort(key=lambda x: x["title"])
+        if neighborhood:
+            active_artworks = [art for art in _artworks_in_neighborhood(self, neighborhood) if art.status == "In place"]
+        else:
+            active_artworks = self.by_status.get("In place", [])
 
         if not active_artworks:
             if neighborhood:
@@ -284,23 +414,23 @@ class Tools:
 
         limited_results = active_artworks[:limit]
 
-        response = f"Found {len(active_artworks)} active artworks"
+        parts: List[str] = [f"Found {len(active_artworks)} active artworks"]
         if neighborhood:
-            response += f" in or near {neighborhood}"
-        response += f" (showing {len(limited_results)}):\n\n"
+            parts.append(f" in or near {neighborhood}")
+        parts.append(f" (showing {len(limited_results)}):\n\n")
 
         for i, art in enumerate(limited_results, 1):
-            response += f"{i}. {art['title']}"
-            if art["location"]:
-                response += f" - Located at: {art['location']}"
-            if art["neighborhood"]:
-                response += f" ({art['neighborhood']})"
-            response += "\n"
+            parts.append(f"{i}. {art.title}")
+            if art.location:
+                parts.append(f" - Located at: {art.location}")
+            if art.neighborhood:
+                parts.append(f" ({art.neighborhood})")
+            parts.append("\n")
 
         if len(active_artworks) > limit:
-            response += f"\nThere are {len(active_artworks) - limit} more active artworks."
+            parts.append(f"\nThere are {len(active_artworks) - limit} more active artworks.")
 
-        return response
+        return "".join(parts)
 
     def compare_artwork_status(self, artwork_names: str) -> str:
         """
@@ -312,77 +442,39 @@ class Tools:
         if not artwork_names:
             return "Error: No artwork names provided"
 
-        names_list = [name.strip() for name in artwork_names.split(",") if name.strip()]
+        names_list = [name for name in _SPLIT_RE.split(artwork_names.strip()) if name]
 
         if not names_list:
             return "Error: Invalid input format. Please provide a comma-separated list of artwork names."
 
-        results = []
+        in_place = []
+        not_in_place = []
+        not_found = []
 
         for name in names_list:
-            found = False
             name_key = name.lower()
 
-            if name_key in self.status_db:
-                art = self.status_db[name_key]
-                results.append({
-                    "name": name,
-                    "title": art["title"],
-                    "status": art["status"],
-                    "found": True
-                })
-                found = True
+            # Try exact match first, then the first fuzzy match
+            if name_key in self.alias_to_idx:
+                art = self.entries[self.alias_to_idx[name_key]]
             else:
-                for key, data in self.status_db.items():
-                    if name_key in key or name_key in data["title"].lower():
-                        results.append({
-                            "name": name,
-                            "title": data["title"],
-                            "status": data["status"],
-                            "found": True
-                        })
-                        found = True
-                        break
-
-            if not found:
-                results.append({
-                    "name": name,
-                    "found": False
-                })
-
-        response = "Artwork Status Comparison:\n\n"
-
-        in_place = []
-        not_in_place = []
-        not_found = []
+                art = next(_iter_fuzzy_matches(self, name_key), None)
 
-        for result in results:
-            if not result["found"]:
-                not_found.append(result["name"])
-            elif result["status"] == "In place":
-                in_place.append(result["title"])
+            if art is None:
+                not_found.append(name)
+            elif art.status == "In place":
+                in_place.append(art.title)
             else:
-                not_in_place.append(f"{result['title']} ({result['status']})")
-
-        if in_place:
-            response += "Currently in place:\n"
-            for i, title in enumerate(in_place, 1):
-                response += f"{i}. {title}\n"
-            response += "\n"
-
-        if not_in_place:
-            response += "Not currently in place:\n"
-            for i, title in enumerate(not_in_place, 1):
-                response += f"{i}. {title}\n"
-            response += "\n"
-
-        if not_found:
-            response += "Not found in database:\n"
-            for i, name in enumerate(not_found, 1):
-                response += f"{i}. {name}\n"
-
-        return response
+                not_in_place.append(f"{art.title} ({art.status})")
+
+        parts: List[str] = ["Artwork Status Comparison:\n\n"]
+        _append_section(parts, "Currently in place:", in_place)
+        _append_section(parts, "Not currently in place:", not_in_place)
+        _append_section(parts, "Not found in database:", not_found)
+
+        return "".join(parts)
     
+    @_cached_response
     def list_artworks_by_neighborhood(self, neighborhood: str, limit: int = 10) -> str:
         """
         List all Vancouver public artworks in a specific neighborhood.
@@ -391,47 +483,30 @@ class Tools:
         :param limit: Maximum number of results to return (default 10).
         :return: List of artworks in the specified neighborhood with their titles and statuses.
         """
-        artworks_in_neighborhood = []
-        seen_titles = set()
-
-        for data in self.status_db.values():
-            if data["title"] in seen_titles:
-                continue
-
-            if data["neighborhood"] and neighborhood.lower() in data["neighborhood"].lower():
-                artworks_in_neighborhood.append(data)
-                seen_titles.add(data["title"])
-
-        artworks_in_neighborhood.sort(key=lambda x: x["title"])
+        artworks_in_neighborhood = _artworks_in_neighborhood(self, neighborhood)
 
         if not artworks_in_neighborhood:
             return f"No artworks found in the {neighborhood} neighborhood."
 
         limited_results = artworks_in_neighborhood[:limit]
 
-        response = f"Found {len(artworks_in_neighborhood)} artworks in {neighborhood} (showing {len(limited_results)}):\n\n"
+        parts: List[str] = [f"Found {len(artworks_in_neighborhood)} artworks in {neighborhood} (showing {len(limited_results)}):\n\n"]
 
         for i, art in enumerate(limited_results, 1):
-            response += f"{i}. {art['title']} - Status: {art['status']}\n"
+            parts.append(f"{i}. {art.title} - Status: {art.status}\n")
 
         if len(artworks_in_neighborhood) > limit:
-            response += f"\nThere are {len(artworks_in_neighborhood) - limit} more artworks in this neighborhood."
+            parts.append(f"\nThere are {len(artworks_in_neighborhood) - limit} more artworks in this neighborhood.")
 
-        return response
+        return "".join(parts)
+    @_cached_response
     def list_known_neighborhoods(self) -> str:
         """
         Lists all known neighborhoods where public artworks are located.
 
         :return: A list of known neighborhoods.
         """
-        neighborhoods = set()
-        for data in self.status_db.values():
-            if data["neighborhood"]:
-                neighborhoods.add(data["neighborhood"])
-
-        neighborhood_list = sorted(list(neighborhoods))
-
-        if not neighborhood_list:
+        if not self.neighborhoods_sorted:
             return "No known neighborhoods found."
 
-        return "Known neighborhoods:\n\n" + "\n".join(f"- {neighborhood}" for neighborhood in neighborhood_list)
\ No newline at end of file
+        return "Known neighborhoods:\n\n" + "\n".join(f"- {neighborhood}" for neighborhood in self.neighborhoods_sorted)
\ No newline at end of file